@@ -1,15 +1,41 @@
+import gc
+import io
 import os
+import re
 import csv
+import json
+import queue
 import shutil
+import hashlib
+import itertools
+import threading
+from collections import Counter
+from contextlib import ExitStack
 # import chardet
 from pathlib import Path
 from datetime import datetime
 from configparser import ConfigParser
 from uni_logger import setup_logger
 
+import numpy as np
 import pandas as pd
 from hdbcli import dbapi
 
+try:
+    import pyarrow as pa  # optional, enables the parse cache
+except ImportError:
+    pa = None
+
+try:
+    import psutil  # optional, enables RSS tracking for the memory budget
+except ImportError:
+    psutil = None
+
+try:
+    import resource  # POSIX only, peak RSS fallback
+except ImportError:
+    resource = None
+
 # from sql_statements import upsert_stmt
 
 # ========================== #
@@ -88,7 +114,17 @@ def update_control_table(
         logger.info(f'📋 Upserted control record for <{file_path.name}> with status: <{status}>')
     except dbapi.Error as e:
         logger.error(f'❌ Failed to upsert control record for <{file_path.name}>: {e}')
-        raise (f'❌ Control table upsert error for <{file_path.name}>: {e}')
+        raise
+
+
+def upsert_control_status(control_callback, target: str, cursor: dbapi.Cursor, *args) -> bool:
+    """Run one target's control-table upsert; a failure is logged, not raised."""
+    try:
+        control_callback(cursor, *args)
+        return True
+    except Exception as e:
+        logger.error(f'❌ Control table update failed for target <{target}>: {e}')
+        return False
 
 
 # ========================== #
@@ -183,10 +219,21 @@ def infer_hana_type(series: pd.Series) -> str:
     return "VARCHAR(255)"
 
 
+def hana_type_length(hana_type: str) -> int:
+    """Return the declared character length of a (N)VARCHAR type, None otherwise."""
+    match = re.fullmatch(r'N?VARCHAR\((\d+)\)', hana_type.strip().upper())
+    return int(match.group(1)) if match else None
+
+
 def table_exists(cursor: dbapi.Cursor, table_name: str) -> bool:
+    catalog = schema_catalog(cursor)
+    if catalog.loaded:
+        return table_name.upper() in catalog.tables
     try:
         cursor.execute(
-            f"SELECT TABLE_NAME FROM TABLES WHERE TABLE_NAME = '{table_name.upper()}'"
+            'SELECT TABLE_NAME FROM TABLES '
+            'WHERE SCHEMA_NAME = CURRENT_SCHEMA AND TABLE_NAME = ?',
+            (table_name.upper(),)
         )
         return cursor.fetchone() is not None
     except dbapi.Error as e:
@@ -265,13 +312,113 @@ def should_skip_file(cursor: dbapi.Cursor, file_path: Path) -> bool:
     return False
 
 
+# ========================== #
+#       Schema Catalog       #
+# ========================== #
+
+class SchemaCatalog:
+    """Tables, columns and INSERT statements of one connection, loaded once per run."""
+
+    def __init__(self, cursor: dbapi.Cursor):
+        self.cursor = cursor
+        self.tables = {}  # table name -> [(column name, HANA type)]
+        self.statements = {}  # (table name, columns) -> INSERT statement
+        self.prepared = {}  # (table name, columns) -> cursor holding the prepared INSERT
+        self.loaded = False
+        try:
+            cursor.execute(
+                'SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE_NAME, LENGTH FROM TABLE_COLUMNS '
+                'WHERE SCHEMA_NAME = CURRENT_SCHEMA ORDER BY TABLE_NAME, POSITION'
+            )
+            for table, column, data_type, length in cursor.fetchall():
+                self.tables.setdefault(table, []).append(
+                    (column, hana_type_signature(data_type, length))
+                )
+            self.loaded = True
+            logger.debug(f'⚠️ Schema catalog loaded: {len(self.tables)} table(s)')
+        except dbapi.Error as e:
+            logger.warning(f'⚠️ Schema catalog not available, checking tables per load: {e}')
+
+    def set_table(self, table_name: str, columns: list = None):
+        """Record a created table, or forget a dropped one when columns is None."""
+        if columns is None:
+            self.tables.pop(table_name, None)
+        else:
+            self.tables[table_name] = columns
+        self.statements = {
+            key: stmt for key, stmt in self.statements.items() if key[0] != table_name
+        }
+        for key in [key for key in self.prepared if key[0] == table_name]:
+            prepared = self.prepared.pop(key)
+            try:
+                if prepared is not None:
+                    prepared.close()
+            except dbapi.Error as e:
+                logger.debug(f'⚠️ Closing prepared INSERT for <{table_name}> failed: {e}')
+
+
+_schema_catalogs = {}  # id(cursor) -> SchemaCatalog
+
+
+def schema_catalog(cursor: dbapi.Cursor) -> SchemaCatalog:
+    catalog = _schema_catalogs.get(id(cursor))
+    if catalog is None or catalog.cursor is not cursor:
+        catalog = _schema_catalogs[id(cursor)] = SchemaCatalog(cursor)
+    return catalog
+
+
+def hana_type_signature(data_type: str, length: int = None) -> str:
+    """Normalise a HANA type for comparison, VARCHAR is stored as NVARCHAR."""
+    data_type = data_type.strip().upper()
+    if length is not None and '(' not in data_type and data_type.endswith('CHAR'):
+        data_type = f'{data_type}({length})'
+    return data_type.removeprefix('N') if data_type.startswith('NVARCHAR') else data_type
+
+
+def insert_statement(cursor: dbapi.Cursor, table_name: str, columns: list) -> str:
+    """Return the cached INSERT statement for a table and column signature."""
+    catalog = schema_catalog(cursor)
+    key = (table_name, tuple(col.upper() for col in columns))
+    insert_stmt = catalog.statements.get(key)
+    if insert_stmt is None:
+        insert_stmt = catalog.statements[key] = (
+            f'INSERT INTO "{table_name}" (\n    '
+            + ',\n    '.join(f'"{col}"' for col in key[1]) +
+            '\n) VALUES (\n    ' +
+            ', '.join(['?'] * len(key[1])) +
+            '\n)'
+        )
+        logger.debug(f'⚠️ insert_stmt = \n{insert_stmt}')
+    return insert_stmt
+
+
+def prepared_insert(cursor: dbapi.Cursor, table_name: str, columns: list):
+    """Return a cursor holding the prepared INSERT for a table and column signature.
+
+    The statement is prepared once per connection and reused for every chunk,
+    so each executemanyprepared call only sends parameters. None when the
+    statement cannot be prepared; callers then use executemany.
+    """
+    catalog = schema_catalog(cursor)
+    key = (table_name, tuple(col.upper() for col in columns))
+    if key not in catalog.prepared:
+        insert_stmt = insert_statement(cursor, table_name, columns)
+        try:
+            catalog.prepared[key] = cursor.prepare(insert_stmt, True)  # ✅ new cursor
+        except (AttributeError, TypeError, dbapi.Error) as e:
+            logger.warning(f'⚠️ Cannot prepare INSERT for <{table_name}>, using executemany: {e}')
+            catalog.prepared[key] = None
+    return catalog.prepared[key]
+
+
 # ========================== #
 #     HANA Table & Insert    #
 # ========================== #
 
 def create_table_from_df(cursor: dbapi.Cursor, df: pd.DataFrame, table_name: str) -> bool:
     # Infer HANA column definitions from DataFrame columns
-    col_defs = [f'"{col.upper()}" {infer_hana_type(df[col])}' for col in df.columns]
+    columns = [(col.upper(), infer_hana_type(df[col])) for col in df.columns]
+    col_defs = [f'"{col}" {hana_type}' for col, hana_type in columns]
 
     if not col_defs:
         logger.error(
@@ -279,6 +426,17 @@ def create_table_from_df(cursor: dbapi.Cursor, df: pd.DataFrame, table_name: str
         )
         return False
 
+    # ✅ Same schema as the existing table: replace the data, skip the DDL
+    catalog = schema_catalog(cursor)
+    signature = [(col, hana_type_signature(hana_type)) for col, hana_type in columns]
+    if catalog.loaded and catalog.tables.get(table_name) == signature:
+        try:
+            cursor.execute(f'TRUNCATE TABLE "{table_name}"')
+            logger.debug(f'🧹 Truncated existing table with unchanged schema: <{table_name}>')
+            return True
+        except dbapi.Error as e:
+            logger.warning(f'ℹ️ Could not truncate table <{table_name}>, recreating: {e}')
+
     drop_stmt = f'DROP TABLE "{table_name}"'
     # Construct CREATE TABLE SQL
     create_stmt = f'CREATE COLUMN TABLE "{table_name}" (\n  {",\n  ".join(col_defs)}\n)'
@@ -289,12 +447,14 @@ def create_table_from_df(cursor: dbapi.Cursor, df: pd.DataFrame, table_name: str
     if table_exists(cursor, table_name):
         try:
             cursor.execute(drop_stmt)
+            catalog.set_table(table_name)
             logger.debug(f'🧹 Dropped existing table: <{table_name}>')
         except dbapi.Error as e:
             logger.warning(f'ℹ️ Could not drop table <{table_name}>: {e}')
 
     try:
         cursor.execute(create_stmt)
+        catalog.set_table(table_name, signature)
         logger.debug(f'✅ Created table: <{table_name}>')
         return True
     except dbapi.Error as e:
@@ -309,26 +469,20 @@ def insert_data(
         chunk_num: int = 0,
     ) -> int:
 
-    # Clean NaNs without applymap
-    values = df.astype(object).where(pd.notnull(df), None).values.tolist()
+    # Clean NaNs without applymap or an intermediate DataFrame copy
+    values = df.to_numpy(dtype=object, na_value=None).tolist()
     row_count = len(values)
     if row_count == 0:
         # no data to insert
         return 0
 
-    columns = ', '.join(f'"{col.upper()}"' for col in df.columns)
-    placeholders = ', '.join(['?'] * len(df.columns))
-    insert_stmt = (
-        f'INSERT INTO "{table_name}" (\n'
-        + ',\n    '.join(f'"{col.upper()}"' for col in df.columns) +
-        '\n) VALUES (\n    ' +
-        ', '.join(['?'] * len(df.columns)) +
-        '\n)'
-    )
-    logger.debug(f'⚠️ insert_stmt = \n{insert_stmt}')
+    prepared = prepared_insert(cursor, table_name, df.columns)
 
     try:
-        cursor.executemany(insert_stmt, values)
+        if prepared is not None:
+            prepared.executemanyprepared(values)
+        else:
+            cursor.executemany(insert_statement(cursor, table_name, df.columns), values)
         logger.debug(
             f'📥 Chunk <{chunk_num}> inserted {len(values)} rows into <{table_name}>'
         )
@@ -340,12 +494,644 @@ def insert_data(
         return -1
 
 
+# ========================== #
+#       Data Validation      #
+# ========================== #
+
+def parse_required_columns(required_columns: str) -> list:
+    """Split the ';' separated 'Required Columns' rule from File_Locations.txt."""
+    if not required_columns:
+        return []
+    return [col.strip().upper() for col in str(required_columns).split(';') if col.strip()]
+
+
+def validate_chunk(
+    chunk: pd.DataFrame,
+    column_widths: dict,
+    required_columns: list,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Split a chunk into rows that fit the target table and rejected rows.
+
+    Rows are rejected when a value is longer than the target column width or a
+    required column is empty. Rejected rows carry LINE_NUMBER and REJECT_REASON.
+    """
+    checks = []  # (reason, row mask)
+
+    widths = {
+        col: width for col, width in column_widths.items()
+        if width is not None and col in chunk.columns
+    }
+    if widths:
+        values = chunk[list(widths)].to_numpy(dtype=object, na_value='')
+        lengths = np.fromiter(
+            map(len, values.ravel()), dtype=np.int64, count=values.size
+        ).reshape(values.shape)
+        too_long = lengths > np.array(list(widths.values()))
+        for i in np.flatnonzero(too_long.any(axis=0)):
+            col = list(widths)[i]
+            checks.append((f'{col} longer than {widths[col]}', too_long[:, i]))
+
+    for col in required_columns:
+        if col in chunk.columns:
+            missing = (chunk[col].isna() | chunk[col].str.strip().eq('')).to_numpy()
+            if missing.any():
+                checks.append((f'{col} is empty', missing))
+
+    if not checks:
+        return chunk, chunk.iloc[0:0]
+
+    rejected_mask = np.logical_or.reduce([mask for _, mask in checks])
+    reasons = np.full(int(rejected_mask.sum()), '', dtype=object)
+    for reason, mask in checks:
+        flagged = mask[rejected_mask]
+        reasons[flagged] += f'; {reason}'
+
+    rejected = chunk[rejected_mask].copy()
+    rejected.insert(0, 'REJECT_REASON', [reason[2:] for reason in reasons])
+    rejected.insert(0, 'LINE_NUMBER', rejected.index)
+
+    return chunk[~rejected_mask], rejected
+
+
+def write_rejects(reject_path: Path, rejected: pd.DataFrame, columns: list) -> int:
+    """Append rejected rows to the reject file, returning the number of rows written.
+
+    Raises when the reject file cannot be written, so rejected rows are never
+    silently lost while the load is reported as completed.
+    """
+    if rejected.empty:
+        return 0
+
+    reject_columns = ['LINE_NUMBER', 'REJECT_REASON', 'RAW_RECORD'] + list(columns)
+    try:
+        reject_path.parent.mkdir(exist_ok=True)
+        rejected.reindex(columns=reject_columns).to_csv(
+            reject_path, mode='a', index=False,
+            header=not reject_path.exists(), encoding='utf-8',
+        )
+    except Exception as e:
+        logger.error(f'❌ Failed to write rejected rows to <{reject_path}>: {e}')
+        raise
+    return len(rejected)
+
+
+def ragged_rows_to_df(ragged_rows: list) -> pd.DataFrame:
+    """Convert (line number, reason, raw record) tuples into reject rows."""
+    return pd.DataFrame(ragged_rows, columns=['LINE_NUMBER', 'REJECT_REASON', 'RAW_RECORD'])
+
+
+# ========================== #
+#         Parse Cache        #
+# ========================== #
+
+def file_fingerprint(file_path: Path) -> str:
+    """Cheap source fingerprint from path, size and modification time (no extra read)."""
+    file_stats = file_path.stat()
+    return f'{file_path}|{file_stats.st_size}|{file_stats.st_mtime_ns}'
+
+
+def parse_cache_path(cache_dir: Path, fingerprint: str, **parse_options) -> Path:
+    """Cache entry path keyed by source fingerprint and parse options."""
+    options = json.dumps(parse_options, sort_keys=True, default=str)
+    key = hashlib.sha256(f'{fingerprint}|{options}'.encode('utf-8')).hexdigest()
+    return cache_dir / f'{key}.arrow'
+
+
+def open_cached_chunks(cache_path: Path, chunksize: int):
+    """Return (parse properties, chunk iterator) for a cached parse, None on a miss."""
+    if pa is None or not cache_path.exists():
+        return None
+    try:
+        source = pa.memory_map(str(cache_path))
+        table = pa.ipc.open_file(source).read_all()  # ✅ zero-copy over the memory map
+        props = json.loads(table.schema.metadata[b'parse_properties'])
+        os.utime(cache_path)  # ✅ mark as recently used for LRU eviction
+    except Exception as e:
+        logger.warning(f'⚠️ Ignoring unreadable parse cache <{cache_path.name}>: {e}')
+        return None
+
+    def iter_chunks():
+        try:
+            for batch in table.to_batches(max_chunksize=chunksize):
+                yield batch.to_pandas().set_index(CACHE_LINE_FIELD).rename_axis(None)
+        finally:
+            source.close()
+
+    return props, iter_chunks()
+
+
+CACHE_LINE_FIELD = '__line__'  # source line numbers, kept for reject files
+
+
+def cache_chunks(reader, cache_path: Path, parse_properties: dict):
+    """Yield chunks from reader while writing them to an Arrow IPC cache file.
+
+    The entry is only published once the reader is exhausted, so a failed or
+    abandoned parse never leaves a partial cache behind. Cache errors are
+    logged and disable caching, they never fail the load.
+    """
+    tmp_path = cache_path.with_suffix('.tmp')
+    writer = None
+    try:
+        for chunk in reader:
+            if writer is None:
+                try:
+                    schema = pa.schema(
+                        [(CACHE_LINE_FIELD, pa.int64())]
+                        + [(str(col), pa.string()) for col in chunk.columns],
+                        metadata={'parse_properties': json.dumps(parse_properties)},
+                    )
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    writer = pa.ipc.new_file(str(tmp_path), schema)
+                except Exception as e:
+                    logger.warning(f'⚠️ Parse cache not writable, caching disabled: {e}')
+                    writer = False
+            if writer:
+                try:
+                    writer.write_batch(pa.RecordBatch.from_pandas(
+                        chunk.set_axis(schema.names[1:], axis=1)
+                        .rename_axis(CACHE_LINE_FIELD).reset_index(),
+                        schema=schema, preserve_index=False,
+                    ))
+                except Exception as e:
+                    logger.warning(f'⚠️ Parse cache write failed, caching disabled: {e}')
+                    writer = discard_cache_file(writer, tmp_path)
+            yield chunk
+
+        if writer:
+            try:
+                writer.close()
+                writer = None
+                tmp_path.replace(cache_path)
+                logger.debug(f'⚠️ Parse cache written: <{cache_path.name}>')
+            except Exception as e:
+                logger.warning(f'⚠️ Parse cache not published, caching disabled: {e}')
+                writer = discard_cache_file(writer, tmp_path)
+    finally:
+        if writer:
+            discard_cache_file(writer, tmp_path)
+
+
+def discard_cache_file(writer, tmp_path: Path) -> bool:
+    """Close and remove an unpublished cache file, returning False (caching disabled)."""
+    try:
+        if writer:
+            writer.close()
+    except Exception as e:
+        logger.debug(f'⚠️ Closing parse cache writer failed: {e}')
+    try:
+        tmp_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f'⚠️ Could not remove partial parse cache <{tmp_path.name}>: {e}')
+    return False
+
+
+def evict_parse_cache(cache_dir: Path, max_bytes: int):
+    """Remove least recently used cache entries until the cache fits max_bytes."""
+    entries = sorted(
+        cache_dir.glob('*.arrow'), key=lambda entry: entry.stat().st_mtime, reverse=True
+    )
+    used = 0
+    for entry in entries:
+        used += entry.stat().st_size
+        if used > max_bytes:
+            try:
+                entry.unlink()
+                logger.debug(f'🧹 Evicted parse cache entry: <{entry.name}>')
+            except OSError as e:
+                logger.warning(f'⚠️ Could not evict parse cache <{entry.name}>: {e}')
+
+
+# ========================== #
+#       Fan-out Targets      #
+# ========================== #
+
+class TargetLoader(threading.Thread):
+    """Create the table and insert chunks for one target connection.
+
+    Chunks arrive through a bounded queue, so a slow target blocks the reader
+    instead of buffering the whole file. A failed target keeps draining its
+    queue so the remaining targets carry on.
+    """
+
+    def __init__(self, target: str, cursor: dbapi.Cursor, table_name: str, queue_depth: int = 2):
+        super().__init__(name=f'loader-{target}', daemon=True)
+        self.target = target
+        self.cursor = cursor
+        self.table_name = table_name
+        self.chunks = queue.Queue(maxsize=max(1, queue_depth))  # maxsize 0 is unbounded
+        self.created = False
+        self.failed = False
+        self.inserted = 0
+
+    def run(self):
+        while (item := self.chunks.get()) is not None:
+            try:
+                self.load(*item)
+            finally:
+                self.chunks.task_done()
+        self.chunks.task_done()
+
+    def load(self, chunk_num: int, chunk: pd.DataFrame):
+        if self.failed:
+            return
+        try:
+            if not self.created:
+                self.created = create_table_from_df(self.cursor, chunk, self.table_name)
+                self.failed = not self.created
+                if self.failed:
+                    return
+            inserted = insert_data(self.cursor, chunk, self.table_name, chunk_num)
+            if inserted < 0:
+                self.failed = True
+            else:
+                self.inserted += inserted
+        except Exception as e:
+            logger.error(f'❌ Target <{self.target}> load failed for <{self.table_name}>: {e}')
+            self.failed = True
+
+
+def start_loaders(targets: dict, table_name: str, queue_depth: int = 2) -> dict:
+    loaders = {
+        target: TargetLoader(target, cursor, table_name, queue_depth)
+        for target, cursor in targets.items()
+    }
+    for loader in loaders.values():
+        loader.start()
+    return loaders
+
+
+def dispatch_chunk(loaders: dict, chunk_num: int, chunk: pd.DataFrame) -> bool:
+    """Queue a chunk to every healthy target, False once all targets have failed."""
+    live = [loader for loader in loaders.values() if not loader.failed]
+    for loader in live:
+        loader.chunks.put((chunk_num, chunk))  # ✅ blocks while the target is behind
+    return bool(live)
+
+
+def stop_loaders(loaders: dict):
+    for loader in loaders.values():
+        if loader.is_alive():
+            loader.chunks.put(None)
+    for loader in loaders.values():
+        loader.join()
+
+
+# ========================== #
+#        Memory Budget       #
+# ========================== #
+
+MIN_CHUNKSIZE = 1000
+PY_STR_OVERHEAD = 57  # CPython str header + object pointer per parsed field
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes, None when it cannot be measured."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+
+class MemoryMonitor:
+    """Track peak RSS of the run against an optional memory budget (bytes)."""
+
+    def __init__(self, budget: int = None):
+        self.budget = budget
+        self.baseline = current_rss() or 0
+        self.peak = self.baseline
+        if budget and psutil is None:
+            logger.warning(
+                '⚠️ psutil is not installed, MEMORY_BUDGET_MB only sizes chunks '
+                '(no RSS throttling).'
+            )
+
+    def sample(self) -> int:
+        rss = current_rss()
+        if rss is not None:
+            self.peak = max(self.peak, rss)
+        return rss
+
+    def over_budget(self) -> bool:
+        rss = self.sample()
+        return bool(self.budget) and rss is not None and rss > self.budget
+
+    def peak_rss(self) -> int:
+        """Peak RSS in bytes, including the OS high-water mark where available."""
+        self.sample()
+        if psutil is not None:
+            # Windows reports the true high-water mark (peak working set)
+            self.peak = max(self.peak, getattr(psutil.Process().memory_info(), 'peak_wset', 0))
+        if resource is not None:
+            # ru_maxrss is reported in KiB on Linux
+            self.peak = max(self.peak, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss << 10)
+        return self.peak
+
+
+def plan_memory_budget(
+    memory: MemoryMonitor,
+    file_path: Path,
+    chunksize: int,
+    target_count: int,
+    queue_depth: int,
+) -> tuple[int, int]:
+    """Size chunks and per-target queue depth so in-flight chunks fit the budget.
+
+    A chunk is held by the parser, the look-ahead, each target queue slot, and
+    once more as the executemany row list, so the budget is split across all
+    of them. Row size is estimated from a raw sample of the file.
+    """
+    queue_depth = max(1, queue_depth)
+    rss = memory.sample() or 0  # ✅ current RSS, earlier files may have grown the heap
+    available = memory.budget - rss
+    if available <= 0:
+        logger.warning(
+            f'⚠️ Memory budget {memory.budget >> 20} MB is below the current RSS '
+            f'{rss >> 20} MB, using minimum chunk size.'
+        )
+        return MIN_CHUNKSIZE, 1
+
+    with open(file_path, 'rb') as f:
+        sample = f.read(1 << 16)
+    lines = sample.splitlines()[:-1] or sample.splitlines() or [b'']
+    line_bytes = sum(len(line) for line in lines) / len(lines)
+    fields = max(lines[0].count(d.encode()) for d in ',;\t|^#') + 2  # + BODS_TIMESTAMP
+    row_bytes = line_bytes + fields * PY_STR_OVERHEAD
+
+    while True:
+        chunks_in_flight = 2 + target_count * (queue_depth + 2)
+        planned = int(available // (chunks_in_flight * row_bytes))
+        if planned >= MIN_CHUNKSIZE or queue_depth <= 1:
+            break
+        queue_depth -= 1
+
+    planned = max(MIN_CHUNKSIZE, min(chunksize, planned))
+    logger.debug(
+        f'⚠️ Memory budget {memory.budget >> 20} MB for <{file_path.name}>: '
+        f'~{int(row_bytes)} bytes/row, chunksize {planned}, queue depth {queue_depth}'
+    )
+    return planned, queue_depth
+
+
+def wait_for_loaders(loaders: dict, memory: MemoryMonitor):
+    """Throttle reading until the targets have drained their queues."""
+    logger.debug(f'⚠️ RSS above memory budget, waiting for inserts to catch up ...')
+    for loader in loaders.values():
+        loader.chunks.join()
+    gc.collect()
+    if memory.over_budget():
+        logger.warning(
+            f'⚠️ RSS {memory.sample() >> 20} MB still above memory budget '
+            f'{memory.budget >> 20} MB with empty queues'
+        )
+
+
 # ========================== #
 #         CSV Pipeline       #
 # ========================== #
 
+# pandas.read_csv default NA strings, loaded as NULL
+NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+
+WIDTH_SAMPLE_RECORDS = 1000  # records used to fix the width of headerless files
+
+
+def mangle_header(header: list) -> list:
+    """Name blank and duplicate header fields the way pandas.read_csv does."""
+    counts = {}
+    columns = []
+    for i, col in enumerate(header):
+        col = col or f'Unnamed: {i}'
+        cur_count = counts.get(col, 0)
+        while cur_count > 0:
+            counts[col] = cur_count + 1
+            col = f'{col}.{cur_count}'
+            cur_count = counts.get(col, 0)
+        counts[col] = cur_count + 1
+        columns.append(col)
+    return columns
+
+
+def csv_dialect(delimiter: str, quotechar: str) -> dict:
+    """csv.reader options matching the pandas C parser settings of the pipeline."""
+    return {
+        'delimiter': delimiter,
+        'quotechar': quotechar or None,
+        'quoting': csv.QUOTE_MINIMAL if quotechar else csv.QUOTE_NONE,
+    }
+
+
+def count_fields(text: str, delimiter: str, quotechar: str) -> tuple:
+    """Count the fields of every line of text, skipping quoted delimiters.
+
+    Returns (counts, unterminated). counts is None when a quoted field spans
+    lines; unterminated is True when text ends inside a quoted field. Well
+    formed quoting is resolved with numpy on the encoded bytes, anything else
+    (e.g. a quote inside an unquoted field) with a regex mirroring the csv module.
+    """
+    quoted = bool(quotechar) and quotechar in text
+    if delimiter.isascii() and (not quoted or quotechar.isascii()):
+        buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        ends = np.flatnonzero(buf == ord('\n'))
+        if not text.endswith('\n'):
+            ends = np.append(ends, len(buf))
+        delims = np.flatnonzero(buf == ord(delimiter))
+        if quoted:
+            is_quote = buf == ord(quotechar)
+            quotes = np.flatnonzero(is_quote)
+            opening, closing = quotes[0::2], quotes[1::2]
+            # quotes must open right after and close right before a field boundary
+            bounds = np.zeros(256, dtype=bool)
+            bounds[[ord(delimiter), ord(quotechar), ord('\n'), ord('\r')]] = True
+            if (bounds[buf[opening[opening > 0] - 1]].all()
+                    and bounds[buf[closing[closing < len(buf) - 1] + 1]].all()):
+                if len(quotes) % 2:
+                    return None, True
+                inside = np.logical_xor.accumulate(is_quote)
+                if inside[ends[ends < len(buf)]].any():
+                    return None, False
+                delims = delims[~inside[delims]]
+                quoted = False
+        if not quoted:
+            return np.diff(np.searchsorted(delims, ends), prepend=0) + 1, False
+
+    stripped = text
+    if quoted:
+        d, q = re.escape(delimiter), re.escape(quotechar)
+        stripped = re.sub(
+            f'(?:^|(?<={d})){q}(?:[^{q}]|{q}{q})*+{q}', '', text, flags=re.MULTILINE
+        )
+        if re.search(f'(?:^|(?<={d})){q}', stripped, flags=re.MULTILINE):
+            return None, True
+    if stripped.count('\n') != text.count('\n'):
+        return None, False
+    records = stripped.split('\n')
+    if text.endswith('\n'):
+        records.pop()
+    return np.array([rec.count(delimiter) + 1 for rec in records], dtype=np.int64), False
+
+
+def split_records(f, first_line: int, delimiter: str, quotechar: str, block_lines: int):
+    """Yield (line numbers, raw records, field counts) for blocks of a text file.
+
+    Fields are counted on the raw text (see count_fields), so the per-record
+    work stays out of Python. Blocks whose quoted fields span lines are split
+    with the csv module instead. Blank records count 0 fields.
+    """
+    while lines := list(itertools.islice(f, block_lines)):
+        while True:
+            counts, unterminated = count_fields(''.join(lines), delimiter, quotechar)
+            # ✅ never cut a block inside a quoted field
+            if not unterminated or not (more := list(itertools.islice(f, block_lines))):
+                break
+            lines += more
+
+        if counts is not None and len(counts) == len(lines):
+            numbers = np.arange(first_line, first_line + len(lines))
+            for i in np.flatnonzero(counts == 1):
+                if not lines[i].strip():
+                    counts[i] = 0
+            raws = lines
+        else:
+            # quoted line breaks: let the csv module find the record boundaries
+            numbers, raws, counts = [], [], []
+            pending = []
+
+            def tracked_lines():
+                for line in lines:
+                    pending.append(line)
+                    yield line
+
+            reader = csv.reader(tracked_lines(), **csv_dialect(delimiter, quotechar))
+            for row in reader:
+                raw = ''.join(pending)
+                numbers.append(first_line + reader.line_num - len(pending))
+                raws.append(raw)
+                counts.append(len(row) if len(row) > 1 or raw.strip() else 0)
+                pending.clear()
+            numbers, counts = np.array(numbers, dtype=np.int64), np.array(counts, dtype=np.int64)
+
+        first_line += len(lines)
+        yield numbers, raws, counts
+
+
+def parse_records(raws: list, numbers, columns: list, delimiter: str, quotechar: str):
+    """Parse complete, fixed-width raw records with the pandas C parser."""
+    if not raws:
+        return strings_frame([], columns, [])
+    chunk = pd.read_csv(
+        io.StringIO(''.join(raws)), sep=delimiter, header=None, names=columns,
+        index_col=False, dtype=str, engine='c', keep_default_na=False, na_values=NA_VALUES,
+        quotechar=quotechar or '"', quoting=csv_dialect(delimiter, quotechar)['quoting'],
+    )
+    if len(chunk) != len(raws):
+        # the C tokenizer and the field counter disagree, trust the csv module
+        logger.debug(f'⚠️ C parser returned {len(chunk)} of {len(raws)} records, re-parsing')
+        rows = csv.reader(
+            io.StringIO(''.join(raws), newline=''), **csv_dialect(delimiter, quotechar)
+        )
+        return strings_frame(list(rows), columns, list(numbers))
+    chunk.index = numbers
+    return chunk
+
+
+def read_csv_chunks(
+    file_path: Path,
+    encoding: str,
+    delimiter: str,
+    quotechar: str,
+    has_header: bool,
+    skip_rows: int,
+    skip_footer: int,
+    chunksize: int,
+    ragged_rows: list,
+):
+    """Yield fixed-width string chunks of a flat file, indexed by source line number.
+
+    Each record's real field count is checked against the header width, or for
+    headerless files the most common width of the first records, before the
+    records are parsed; pandas.read_csv pads short rows and can truncate long
+    ones at a chunk boundary without a warning. Ragged rows are appended to
+    ragged_rows as (line number, reason, raw record) instead of being loaded.
+    The last skip_footer records are dropped first.
+    """
+    csv.field_size_limit(2**31 - 1)
+    with open(file_path, 'r', newline='', encoding=encoding) as f:
+        for _ in range(skip_rows):
+            f.readline()
+        blocks = split_records(f, skip_rows + 1, delimiter, quotechar, chunksize)
+
+        # read ahead to the header, or enough records to fix a headerless width
+        head = []
+        sampled = 0
+        for block in blocks:
+            head.append(block)
+            sampled += np.count_nonzero(block[2])
+            if sampled >= (1 if has_header else WIDTH_SAMPLE_RECORDS):
+                break
+        counts = np.concatenate([np.empty(0, dtype=np.int64)] + [block[2] for block in head])
+        keep = counts > 0
+        if not keep.any():
+            raise pd.errors.EmptyDataError('No columns to parse from file')
+        numbers = np.concatenate([block[0] for block in head])[keep]
+        raws = list(itertools.compress(
+            itertools.chain.from_iterable(block[1] for block in head), keep
+        ))
+        counts = counts[keep]
+
+        if has_header:
+            header = next(csv.reader(
+                io.StringIO(raws[0], newline=''), **csv_dialect(delimiter, quotechar)
+            ))
+            columns = mangle_header(header)
+            numbers, raws, counts = numbers[1:], raws[1:], counts[1:]
+        else:
+            widths = Counter(counts[:WIDTH_SAMPLE_RECORDS].tolist()).most_common()
+            columns = list(range(max(w for w, n in widths if n == widths[0][1])))
+        width = len(columns)
+
+        footer = (np.empty(0, dtype=np.int64), [], np.empty(0, dtype=np.int64))
+        yielded = False
+        for numbers, raws, counts in itertools.chain([(numbers, raws, counts)], blocks):
+            keep = counts > 0
+            numbers = np.concatenate([footer[0], numbers[keep]])
+            raws = footer[1] + list(itertools.compress(raws, keep))
+            counts = np.concatenate([footer[2], counts[keep]])
+            if skip_footer:
+                # hold back the last records until the next block proves they are not the footer
+                cut = max(len(raws) - skip_footer, 0)
+                footer = (numbers[cut:], raws[cut:], counts[cut:])
+                numbers, raws, counts = numbers[:cut], raws[:cut], counts[:cut]
+
+            good = counts == width
+            for i in np.flatnonzero(~good):
+                ragged_rows.append((
+                    int(numbers[i]), f'expected {width} fields, saw {counts[i]}',
+                    raws[i].rstrip('\r\n'),
+                ))
+            if good.any():
+                yield parse_records(
+                    list(itertools.compress(raws, good)), numbers[good],
+                    columns, delimiter, quotechar,
+                )
+                yielded = True
+
+        if len(footer[1]):
+            logger.debug(f'⚠️ Skipped {len(footer[1])} footer record(s) of <{file_path.name}>')
+        if not yielded:
+            yield strings_frame([], columns, [])
+
+
+def strings_frame(rows: list, columns: list, lines: list) -> pd.DataFrame:
+    chunk = pd.DataFrame(rows, columns=columns, index=lines, dtype=object)
+    return chunk.mask(chunk.isin(NA_VALUES))
+
+
 def process_csv_file_in_chunks(
-    cursor: dbapi.Cursor,
+    targets: dict,
     file_path: Path,
     table_name: str,
     chunksize: int = 50000,
@@ -356,13 +1142,23 @@ def process_csv_file_in_chunks(
     quotechar: str = None,
     skip_rows : int = 0, # skip first N lines
     skip_footer : int = 0,  # skip last N lines
+    required_columns: list = None,
+    reject_dir_name: str = "Rejects",
+    cache_dir: Path = None,
+    cache_max_bytes: int = None,
+    queue_depth: int = 2,
+    memory: MemoryMonitor = None,
     control_callback=None,
 ) -> bool:
+    """Read and parse a file once and load it into every target {name: cursor}.
+
+    Returns True only when all targets loaded successfully; each target gets
+    its own control table status.
+    """
     if not file_path.exists():
         logger.error(f'❌ File not found: <{file_path.resolve()}>')
         return False    
 
-    total_inserted = 0
     # first_chunk = True
     encodings_to_try = [encoding, 'utf-8-sig', 'latin1'] if encoding else ['utf-8-sig', 'latin1']
     if timestamp is None:
@@ -371,11 +1167,49 @@ def process_csv_file_in_chunks(
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         logger.debug(f'⚠️ BODS ETL timestamp: <{timestamp}>')
 
+    required_columns = required_columns or []
+    parse_options = {
+        'has_header': has_header, 'delimiter': delimiter,
+        'quotechar': quotechar, 'skip_rows': skip_rows, 'skip_footer': skip_footer,
+    }
+    if memory and memory.budget:
+        chunksize, queue_depth = plan_memory_budget(
+            memory, file_path, chunksize, len(targets), queue_depth
+        )
+    cache_path = None
+    cached = None
+    if cache_dir and pa is not None:
+        try:
+            cache_path = parse_cache_path(
+                cache_dir, file_fingerprint(file_path), encoding=encoding, **parse_options
+            )
+            cached = open_cached_chunks(cache_path, chunksize)
+        except OSError as e:
+            logger.warning(f'⚠️ Parse cache disabled for <{file_path.name}>: {e}')
+    if cached:
+        # ✅ Decode with the encoding that worked when the entry was written
+        encodings_to_try = [cached[0]['encoding']]
+    reject_path = file_path.parent / reject_dir_name / (
+        f"{file_path.stem}_{datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S'):%Y%m%d_%H%M%S}"
+        f"_rejects.csv"
+    )
+
     for enc in encodings_to_try:
         logger.debug(f'⚠️ Trying encoding: <{enc}>')
+        loaders = {}
+        reported = set()  # targets whose final status is in the control table
+        total_rejected = 0
+        ragged_rows = []
+        ragged_count = 0
 
         try:
-            props = detect_csv_properties(file_path, encoding=enc)
+            reject_path.unlink(missing_ok=True)  # discard rejects from a failed encoding attempt
+
+            props = cached[0] if cached else detect_csv_properties(file_path, encoding=enc)
+            if not props and delimiter and has_header is not None:
+                # ✅ Ragged rows can defeat the sniffer, use the File_Locations.txt settings
+                logger.warning(f'⚠️ Using configured file properties for <{file_path.name}>')
+                props = {'has_header': has_header, 'delimiter': delimiter, 'quotechar': '"'}
             if not props:
                 logger.error(f'❌ Cannot detect file properties: <{file_path.resolve()}>')
                 return False
@@ -383,32 +1217,28 @@ def process_csv_file_in_chunks(
             delimiter = delimiter or props['delimiter']
             quotechar = quotechar or props['quotechar']
 
-            read_csv_kwargs = {
-                'filepath_or_buffer': file_path,
-                'encoding': enc,
-                'chunksize': chunksize,
-                'delimiter': delimiter,
-                'quotechar': quotechar,
-                'skiprows': skip_rows,
-                # 'skipfooter': skip_bottom,
-                'low_memory': False,
-                'dtype': str,  # ✅ Prevent type inference that removes leading zeros
-            }
-            if not has_header:
-                read_csv_kwargs['header'] = None
-
-            logger.debug(f'⚠️ read_csv_kwargs: \n{read_csv_kwargs}')
-
-            reader = pd.read_csv(**read_csv_kwargs)
-            first_chunk = True
+            if cached:
+                logger.info(f'♻️ Reading <{file_path.name}> from parse cache <{cache_path.name}>')
+                reader = cached[1]
+            else:
+                reader = read_csv_chunks(
+                    file_path, enc, delimiter, quotechar, has_header,
+                    skip_rows, skip_footer, chunksize, ragged_rows,
+                )
+                if cache_path:
+                    reader = cache_chunks(reader, cache_path, {
+                        'has_header': has_header, 'delimiter': delimiter,
+                        'quotechar': quotechar, 'encoding': enc,
+                    })
             chunk_num = 1
 
-            try:
-                chunk = next(reader)
-            except StopIteration:
+            chunk = next(reader, None)
+            if chunk is None:
                 return False  # no data
 
-            while True:
+            loaders = start_loaders(targets, table_name, queue_depth)
+
+            while chunk is not None:
                 _, column_count = chunk.shape
 
                 if has_header:
@@ -416,64 +1246,103 @@ def process_csv_file_in_chunks(
                 else:
                     chunk.columns = [f"COL{str(i+1).zfill(3)}" for i in range(chunk.shape[1])]
 
-                chunk = chunk.where(pd.notnull(chunk), None)
                 chunk["BODS_TIMESTAMP"] = timestamp
 
-                if first_chunk:
-                    success = create_table_from_df(cursor, chunk, table_name)
-                    if not success:
-                        return False
-                    first_chunk = False
-
-                try:
-                    next_chunk = next(reader)
-                    inserted = insert_data(cursor, chunk, table_name, chunk_num)
-                    if inserted < 0:
-                        return False
-                    total_inserted += inserted
-                    chunk_num += 1
-                    chunk = next_chunk
-                except StopIteration:
-                    # last chunk
-                    if skip_footer > 0 and skip_footer < len(chunk):
-                        chunk = chunk.iloc[:-skip_footer, :]
-                    elif skip_footer >= len(chunk):
-                        logger.warning(f'⚠️ skip_footer ({skip_footer}) >= chunk size ({len(chunk)}), skipping entire chunk.')
-                        break
-
-                    inserted = insert_data(cursor, chunk, table_name, chunk_num)
-                    if inserted < 0:
-                        return False
-                    total_inserted += inserted
-                    break
-
-            logger.info(f'✅ Total rows inserted into <{table_name}>: {total_inserted}')
-
-            if control_callback:
-                control_callback(
-                    cursor, file_path, table_name, skip_rows, skip_footer, enc, 
-                    has_header, delimiter, quotechar,
-                    timestamp, total_inserted, column_count,
-                    "BODS COMPLETED"
+                if chunk_num == 1:
+                    dispatch_chunk(loaders, 0, chunk.iloc[0:0])  # ✅ create target tables
+                    columns = chunk.columns
+                    column_widths = {
+                        col: hana_type_length(infer_hana_type(chunk[col]))
+                        for col in columns
+                    }
+                    missing_required = set(required_columns) - set(columns)
+                    if missing_required:
+                        logger.warning(
+                            f'⚠️ Required column(s) not found in <{file_path.name}>: '
+                            f'{sorted(missing_required)}'
+                        )
+
+                ragged_count += len(ragged_rows)
+                total_rejected += write_rejects(
+                    reject_path, ragged_rows_to_df(ragged_rows), columns
+                )
+                ragged_rows.clear()
+                chunk, rejected = validate_chunk(chunk, column_widths, required_columns)
+                total_rejected += write_rejects(reject_path, rejected, columns)
+                if not dispatch_chunk(loaders, chunk_num, chunk):
+                    if cache_path and not cached and not ragged_count:
+                        # ✅ finish the parse cache, the re-run after the DB issue skips parsing
+                        try:
+                            while not ragged_rows and next(reader, None) is not None:
+                                pass
+                        except Exception as e:
+                            logger.warning(
+                                f'⚠️ Parse cache for <{file_path.name}> not completed: {e}'
+                            )
+                    break  # all targets failed, stop loading
+                chunk_num += 1
+
+                if memory and memory.over_budget():
+                    wait_for_loaders(loaders, memory)
+                chunk = next(reader, None)
+
+            stop_loaders(loaders)
+
+            ragged_count += len(ragged_rows)
+            total_rejected += write_rejects(reject_path, ragged_rows_to_df(ragged_rows), columns)
+            if cache_path and not cached:
+                if ragged_count:
+                    # ragged rows are not replayable from the cache
+                    cache_path.unlink(missing_ok=True)
+                elif cache_max_bytes:
+                    evict_parse_cache(cache_dir, cache_max_bytes)
+            if total_rejected:
+                logger.warning(
+                    f'⚠️ {total_rejected} row(s) of <{file_path.name}> rejected ➜ <{reject_path}>'
                 )
 
-            return  True # success
+            for target, loader in loaders.items():
+                if loader.failed:
+                    logger.error(f'❌ Load into <{table_name}> failed for target <{target}>')
+                else:
+                    logger.info(
+                        f'✅ Total rows inserted into <{table_name}> ({target}): {loader.inserted}'
+                    )
+                if control_callback and not upsert_control_status(
+                    control_callback, target,
+                    loader.cursor, file_path, table_name, skip_rows, skip_footer, enc, 
+                    has_header, delimiter, quotechar,
+                    timestamp,
+                    0 if loader.failed else loader.inserted,
+                    0 if loader.failed else column_count,
+                    "BODS FAILED" if loader.failed else "BODS COMPLETED"
+                ):
+                    loader.failed = True  # status not recorded, load the file again
+                reported.add(target)
+
+            return not any(loader.failed for loader in loaders.values())
         except UnicodeDecodeError:
+            stop_loaders(loaders)
             logger.warning(
                 f'⚠️ Encoding <{enc}> failed for <{file_path.name}>, trying fallback ...'
             )
         except Exception as e:
+            stop_loaders(loaders)
             logger.error(
                 f'❌ Error reading <{file_path.name}> with encoding <{enc}>: {e}'
             )
 
             if control_callback:
-                control_callback(
-                    cursor, file_path, table_name, skip_rows, skip_footer, enc, 
-                    has_header, delimiter, quotechar, 
-                    timestamp, 0, 0,
-                    "BODS FAILED"
-                )
+                for target, cursor in targets.items():
+                    if target in reported:
+                        continue  # ✅ keep the status of targets that already finished
+                    upsert_control_status(
+                        control_callback, target,
+                        cursor, file_path, table_name, skip_rows, skip_footer, enc, 
+                        has_header, delimiter, quotechar, 
+                        timestamp, 0, 0,
+                        "BODS FAILED"
+                    )
 
             break
 
@@ -529,7 +1398,7 @@ def read_file_list(file_path: Path, path_prefix: str = None) -> list:
         # file_list = list(zip(df['File Name'].tolist(), df['Table Name'].tolist()))
         # Fill missing columns if older format
         for col in ['Skip Rows', 'Skip Footer', 'Encoding', 
-                    'Has Header', 'Delimiter', 'Quotechar']:
+                    'Has Header', 'Delimiter', 'Quotechar', 'Required Columns']:
             if col not in df.columns:
                 df[col] = None
         df = df.where(pd.notnull(df), None)
@@ -560,12 +1429,36 @@ def main():
     FORCE_LOAD = os.getenv("FORCE_LOAD", "false").lower() == "true"
     # archive loaded file if FILE_ARCHIVE is True
     FILE_ARCHIVE = os.getenv("FILE_ARCHIVE", "false").lower() == "true" 
+    # cache parsed files as Arrow in PARSE_CACHE_DIR (disabled when not set)
+    PARSE_CACHE_DIR = Path(os.getenv("PARSE_CACHE_DIR")) if os.getenv("PARSE_CACHE_DIR") else None
+    PARSE_CACHE_MAX_MB = int(os.getenv("PARSE_CACHE_MAX_MB", "2048"))
+    if PARSE_CACHE_DIR and pa is None:
+        logger.warning(f'⚠️ PARSE_CACHE_DIR is set but pyarrow is not installed, cache disabled.')
 
     ENVIRONMENT = os.getenv("ENVIRONMENT", "SBX").upper()
     ENV, AWS_BASE = aws_env(CONFIG_PATH, ENVIRONMENT)
+    # load files read from ENVIRONMENT into each of TARGET_ENVIRONMENTS (e.g. "DEV,UAT")
+    TARGET_ENVS = list(dict.fromkeys(
+        aws_env(CONFIG_PATH, target.strip().upper())[0]
+        for target in os.getenv("TARGET_ENVIRONMENTS", ENVIRONMENT).split(",")
+        if target.strip()
+    ))
+    # chunks buffered per target before a slow target blocks the reader
+    FANOUT_QUEUE_DEPTH = int(os.getenv("FANOUT_QUEUE_DEPTH", "2"))
+    if FANOUT_QUEUE_DEPTH < 1:
+        logger.warning(f'⚠️ FANOUT_QUEUE_DEPTH <{FANOUT_QUEUE_DEPTH}> is below 1, using 1.')
+        FANOUT_QUEUE_DEPTH = 1
+    # cap chunk size, queue depth and reading pace to MEMORY_BUDGET_MB (disabled when not set)
+    MEMORY_BUDGET_MB = int(os.getenv("MEMORY_BUDGET_MB") or 0)
+    MEMORY = MemoryMonitor(MEMORY_BUDGET_MB << 20 if MEMORY_BUDGET_MB else None)
 
     logger.debug(f'🐍 ENVIRONMENT: <{ENVIRONMENT}>, ENV: <{ENV}>, AWS_BASE: <{AWS_BASE}>')
+    logger.debug(f'🐍 TARGET_ENVS: <{TARGET_ENVS}>, FANOUT_QUEUE_DEPTH: <{FANOUT_QUEUE_DEPTH}>')
+    logger.debug(f'🐍 MEMORY_BUDGET_MB: <{MEMORY_BUDGET_MB}>')
     logger.debug(f'🐍 FORCE_LOAD: <{FORCE_LOAD}>, FILE_ARCHIVE: <{FILE_ARCHIVE}>')
+    logger.debug(
+        f'🐍 PARSE_CACHE_DIR: <{PARSE_CACHE_DIR}>, PARSE_CACHE_MAX_MB: <{PARSE_CACHE_MAX_MB}>'
+    )
 
     file_list = read_file_list(Path("File_Locations.txt"))
 
@@ -573,12 +1466,26 @@ def main():
     sipped_files = 0
     success_files = 0
 
-    logger.info(f'⏩ Loading file(s) to Datasphere ({ENV}) from: <{AWS_BASE}> ...')
+    logger.info(
+        f'⏩ Loading file(s) to Datasphere ({", ".join(TARGET_ENVS)}) from: <{AWS_BASE}> ...'
+    )
 
     # timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     logger.debug(f'⚠️ BODS ETL timestamp: <{timestamp}>')
-    with ds_conn(CONFIG_PATH, ENV).cursor() as cursor:
+    with ExitStack() as stack:
+        # connect each target separately so one unreachable target does not stop the others
+        cursors, unreachable = {}, []
+        for target in TARGET_ENVS:
+            try:
+                cursors[target] = stack.enter_context(ds_conn(CONFIG_PATH, target).cursor())
+            except Exception as e:
+                logger.error(f'❌ Cannot connect to Datasphere <{target}>, skipping target: {e}')
+                unreachable.append(target)
+        if not cursors:
+            raise ConnectionError(
+                f'Cannot connect to any Datasphere target: <{", ".join(TARGET_ENVS)}>'
+                )
         # for location, provided_table_name in file_list:
         for row in file_list:
             location = row.get('File Name')
@@ -590,6 +1497,7 @@ def main():
                 == 'true' if row.get('Has Header') else None
             delimiter = row.get('Delimiter') or None
             quotechar = row.get('Quotechar') or None
+            required_columns = parse_required_columns(row.get('Required Columns'))
 
             logger.info(f'⏩ Loading from: <{location}> ...')
             path = Path(f'{AWS_BASE}/{location}')
@@ -598,8 +1506,13 @@ def main():
                 total_files += 1
                 if FORCE_LOAD:
                     logger.info(f'⏩ Force loading: <{path}> ...')                     
+                    targets = cursors
                 else:
-                    if should_skip_file(cursor, path):
+                    targets = {
+                        target: cursor for target, cursor in cursors.items()
+                        if not should_skip_file(cursor, path)
+                    }
+                    if not targets:
                         sipped_files += 1
                         continue
 
@@ -607,27 +1520,41 @@ def main():
                 table_name = provided_table_name.strip() if provided_table_name and \
                                 str(provided_table_name).strip() else sanitize_table_name(path.name)
 
-                # ✅ Explicitly set BODS STARTED
-                update_control_table(cursor, path, table_name, skip_rows, skip_footer,
-                                     encoding or 'unknown', 
-                                     has_header if has_header is not None else False, 
-                                     delimiter or ',', quotechar or '', 
-                                     timestamp, None, None, 'BODS STARTED')
+                # ✅ Explicitly set BODS STARTED, a target whose control table fails is not loaded
+                started = {
+                    target: cursor for target, cursor in targets.items()
+                    if upsert_control_status(
+                        update_control_table, target,
+                        cursor, path, table_name, skip_rows, skip_footer,
+                        encoding or 'unknown',
+                        has_header if has_header is not None else False,
+                        delimiter or ',', quotechar or '',
+                        timestamp, None, None, 'BODS STARTED'
+                    )
+                }
 
-                success = process_csv_file_in_chunks(
-                    cursor, path, table_name, timestamp=timestamp, 
+                success = bool(started) and process_csv_file_in_chunks(
+                    started, path, table_name, timestamp=timestamp, 
                     control_callback=update_control_table,
                     skip_rows=skip_rows, skip_footer=skip_footer, 
                     encoding=encoding, has_header=has_header, 
-                    delimiter=delimiter, quotechar=quotechar
-                )
+                    delimiter=delimiter, quotechar=quotechar,
+                    required_columns=required_columns,
+                    cache_dir=PARSE_CACHE_DIR, cache_max_bytes=PARSE_CACHE_MAX_MB << 20,
+                    queue_depth=FANOUT_QUEUE_DEPTH, memory=MEMORY,
+                ) and len(started) == len(targets)
 
-                if success:
+                if success and not unreachable:
                     if FILE_ARCHIVE:
                         archive_csv_file(path, timestamp=timestamp)
                     else:
                         logger.debug(f'⚠️ Skipped archiving <{path.name}> as archive set False.')
                     success_files += 1
+                elif success:
+                    logger.warning(
+                        f'⚠️ <{path.name}> not loaded to unreachable '
+                        f'target(s) ({", ".join(unreachable)}), kept for the next run.'
+                    )
                 else:
                     if FILE_ARCHIVE:
                         logger.warning(f'⚠️ Skipped archiving <{path.name}> due to load failure.')
@@ -638,29 +1565,43 @@ def main():
                     total_files += 1
                     if FORCE_LOAD:
                         logger.info(f'⏩ Force loading: <{file_path}> ...')                     
+                        targets = cursors
                     else:
-                        if should_skip_file(cursor, file_path):
+                        targets = {
+                            target: cursor for target, cursor in cursors.items()
+                            if not should_skip_file(cursor, file_path)
+                        }
+                        if not targets:
                             sipped_files += 1
                             continue
 
                     table_name = sanitize_table_name(file_path.name)
 
-                    # ✅ Explicitly set BODS STARTED
-                    update_control_table(cursor, file_path, table_name, skip_rows, skip_footer, 
-                                         encoding or 'unknown', 
-                                         has_header if has_header is not None else False,
-                                         delimiter or ',', quotechar or '', 
-                                         timestamp, 0, 0, 'BODS STARTED')
-
-                    success = process_csv_file_in_chunks(
-                        cursor, file_path, table_name, timestamp=timestamp, 
+                    # ✅ Explicitly set BODS STARTED, a target whose control table fails is not loaded
+                    started = {
+                        target: cursor for target, cursor in targets.items()
+                        if upsert_control_status(
+                            update_control_table, target,
+                            cursor, file_path, table_name, skip_rows, skip_footer,
+                            encoding or 'unknown',
+                            has_header if has_header is not None else False,
+                            delimiter or ',', quotechar or '',
+                            timestamp, 0, 0, 'BODS STARTED'
+                        )
+                    }
+
+                    success = bool(started) and process_csv_file_in_chunks(
+                        started, file_path, table_name, timestamp=timestamp, 
                         control_callback=update_control_table,
                         skip_rows=skip_rows, skip_footer=skip_footer,
                         encoding=encoding, has_header=has_header, 
-                        delimiter=delimiter, quotechar=quotechar
-                    )
+                        delimiter=delimiter, quotechar=quotechar,
+                        required_columns=required_columns,
+                        cache_dir=PARSE_CACHE_DIR, cache_max_bytes=PARSE_CACHE_MAX_MB << 20,
+                        queue_depth=FANOUT_QUEUE_DEPTH, memory=MEMORY,
+                    ) and len(started) == len(targets)
 
-                    if success:
+                    if success and not unreachable:
                         if FILE_ARCHIVE:
                             archive_csv_file(file_path, timestamp=timestamp)
                         else:
@@ -668,6 +1609,11 @@ def main():
                                 f'⚠️ Skipped archiving <{file_path.name}> as archive set False.'
                             )
                         success_files += 1
+                    elif success:
+                        logger.warning(
+                            f'⚠️ <{file_path.name}> not loaded to unreachable '
+                            f'target(s) ({", ".join(unreachable)}), kept for the next run.'
+                        )
                     else:
                         if FILE_ARCHIVE:
                             logger.warning(
@@ -677,7 +1623,7 @@ def main():
                 logger.warning(f'⚠️ Path does not exist or is not valid CSV: <{path.resolve()}>')
 
     # 🔚 Summary log
-    logger.info(f'🏁 Finished for Datasphere ({ENV}) from: <{AWS_BASE}>')
+    logger.info(f'🏁 Finished for Datasphere ({", ".join(TARGET_ENVS)}) from: <{AWS_BASE}>')
     logger.info(
         f'📁 Files and folders: {len(file_list)} | '
         f'📦 Total files: {total_files} | '
@@ -685,6 +1631,12 @@ def main():
         f'✅ Loaded: {success_files} | '
         f'❌ Failed: {total_files - success_files - sipped_files}'
     )
+    if unreachable:
+        logger.error(f'❌ Unreachable targets: {", ".join(unreachable)}')
+    logger.info(
+        f'🧠 Peak RSS: {MEMORY.peak_rss() >> 20} MB'
+        + (f' | Memory budget: {MEMORY_BUDGET_MB} MB' if MEMORY_BUDGET_MB else '')
+    )
 
 
 # ========================== #
@@ -0,0 +1,18 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope='session')
+def etl(tmp_path_factory):
+    """aws-files-to-ds.py loaded as a module; its logger writes Logs/ to a temp folder."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(str(ROOT))
+        mp.chdir(tmp_path_factory.mktemp('run'))
+        spec = importlib.util.spec_from_file_location('aws_files_to_ds', ROOT / 'aws-files-to-ds.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
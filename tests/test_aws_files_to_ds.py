@@ -0,0 +1,191 @@
+import pandas as pd
+import pytest
+from hdbcli import dbapi
+
+
+class FakeCursor:
+    """Minimal hdbcli cursor: records statements and inserted rows."""
+
+    def __init__(self, fail_insert: bool = False):
+        self.statements = []
+        self.rows = []
+        self.fail_insert = fail_insert
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return None
+
+    def prepare(self, sql, newcursor=False):
+        self.statements.append(sql)
+        return self
+
+    def executemanyprepared(self, values):
+        if self.fail_insert:
+            raise dbapi.Error('connection lost')
+        self.rows.extend(values)
+
+
+def read_all(etl, path, has_header=True, skip_footer=0, chunksize=2, delimiter=','):
+    ragged_rows = []
+    chunks = list(etl.read_csv_chunks(
+        path, 'utf-8', delimiter, '"', has_header, 0, skip_footer, chunksize, ragged_rows,
+    ))
+    return pd.concat(chunks), ragged_rows
+
+
+# ========================== #
+#        read_csv_chunks     #
+# ========================== #
+
+def test_ragged_rows_are_rejected_with_their_source_text(etl, tmp_path):
+    path = tmp_path / 'ragged.csv'
+    path.write_text('id,name,city\n1,ann,x\n2,short\n3,c,d,extra\n4,bob,y\n', newline='')
+
+    data, ragged_rows = read_all(etl, path)
+
+    assert data.index.tolist() == [2, 5]
+    assert data.values.tolist() == [['1', 'ann', 'x'], ['4', 'bob', 'y']]
+    assert ragged_rows == [
+        (3, 'expected 3 fields, saw 2', '2,short'),
+        (4, 'expected 3 fields, saw 4', '3,c,d,extra'),
+    ]
+
+
+def test_long_row_at_chunk_start_is_not_truncated(etl, tmp_path):
+    path = tmp_path / 'boundary.csv'
+    path.write_text('a,b\n1,2\n3,4\n5,6,7\n8,9\n', newline='')
+
+    data, ragged_rows = read_all(etl, path, chunksize=2)
+
+    assert data.values.tolist() == [['1', '2'], ['3', '4'], ['8', '9']]
+    assert ragged_rows == [(4, 'expected 2 fields, saw 3', '5,6,7')]
+
+
+def test_quoted_delimiters_and_newlines_stay_in_one_field(etl, tmp_path):
+    path = tmp_path / 'quoted.csv'
+    path.write_text('id,name,city\n1,"a,b",x\n\n2,"multi\nline",y\n3,"x",\n', newline='')
+
+    data, ragged_rows = read_all(etl, path)
+
+    assert ragged_rows == []
+    assert data.index.tolist() == [2, 4, 6]
+    assert data.iloc[:2].values.tolist() == [['1', 'a,b', 'x'], ['2', 'multi\nline', 'y']]
+    assert data.loc[6, 'name'] == 'x'
+    assert pd.isna(data.loc[6, 'city'])  # empty fields load as NULL
+
+
+def test_quoted_ragged_row_keeps_its_quotes(etl, tmp_path):
+    path = tmp_path / 'quoted_ragged.csv'
+    path.write_text('a,b,c\n"a,b",c\n1,2,3\n', newline='')
+
+    _, ragged_rows = read_all(etl, path)
+
+    assert ragged_rows == [(2, 'expected 3 fields, saw 2', '"a,b",c')]
+
+
+def test_footer_records_are_skipped(etl, tmp_path):
+    path = tmp_path / 'footer.csv'
+    path.write_text('id,v\n1,a\n2,b\n3,c\nTOTAL 3\n', newline='')
+
+    data, ragged_rows = read_all(etl, path, skip_footer=1)
+
+    assert data['id'].tolist() == ['1', '2', '3']
+    assert ragged_rows == []
+
+
+def test_headerless_width_is_the_most_common_field_count(etl, tmp_path):
+    path = tmp_path / 'headerless.txt'
+    path.write_text('x;1\ny;2;b\nz;3;c\nw;4;d\n', newline='')
+
+    data, ragged_rows = read_all(etl, path, has_header=False, delimiter=';')
+
+    assert data.shape == (3, 3)
+    assert data.index.tolist() == [2, 3, 4]
+    assert ragged_rows == [(1, 'expected 3 fields, saw 2', 'x;1')]
+
+
+# ========================== #
+#        validate_chunk      #
+# ========================== #
+
+def test_validate_chunk_rejects_long_values_and_empty_required_columns(etl):
+    chunk = pd.DataFrame(
+        {'A': ['abc', 'toolong', 'x', 'ok'], 'B': ['1', ' ', None, '2']},
+        index=[2, 3, 4, 5],
+    )
+
+    valid, rejected = etl.validate_chunk(chunk, {'A': 5, 'B': None}, ['B'])
+
+    assert valid.index.tolist() == [2, 5]
+    assert rejected['LINE_NUMBER'].tolist() == [3, 4]
+    assert rejected['REJECT_REASON'].tolist() == ['A longer than 5; B is empty', 'B is empty']
+
+
+def test_validate_chunk_without_rules_keeps_every_row(etl):
+    chunk = pd.DataFrame({'A': ['x' * 500]}, index=[2])
+
+    valid, rejected = etl.validate_chunk(chunk, {'A': None}, [])
+
+    assert valid.equals(chunk)
+    assert rejected.empty
+
+
+# ========================== #
+#      Fan-out isolation     #
+# ========================== #
+
+def test_failed_target_does_not_stop_the_others(etl):
+    healthy, broken = FakeCursor(), FakeCursor(fail_insert=True)
+    chunk = pd.DataFrame({'A': ['1', '2']})
+
+    loaders = etl.start_loaders({'DEV': healthy, 'UAT': broken}, 'T_FANOUT', queue_depth=1)
+    try:
+        assert etl.dispatch_chunk(loaders, 0, chunk.iloc[0:0])
+        for chunk_num in range(1, 4):
+            assert etl.dispatch_chunk(loaders, chunk_num, chunk)
+    finally:
+        etl.stop_loaders(loaders)
+
+    assert loaders['UAT'].failed
+    assert not loaders['DEV'].failed
+    assert loaders['DEV'].inserted == len(healthy.rows) == 6
+
+
+def test_dispatch_reports_when_all_targets_failed(etl):
+    loaders = etl.start_loaders({'DEV': FakeCursor(fail_insert=True)}, 'T_ALL_FAILED')
+    try:
+        etl.dispatch_chunk(loaders, 1, pd.DataFrame({'A': ['1']}))
+        loaders['DEV'].chunks.join()
+        assert not etl.dispatch_chunk(loaders, 2, pd.DataFrame({'A': ['2']}))
+    finally:
+        etl.stop_loaders(loaders)
+
+
+def test_control_table_failure_only_fails_its_target(etl, tmp_path):
+    path = tmp_path / 'control.csv'
+    path.write_text('id,name\n1,a\n2,b\n', newline='')
+    targets = {'DEV': FakeCursor(), 'UAT': FakeCursor()}
+    statuses = []
+
+    def control_callback(cursor, *args):
+        target = 'DEV' if cursor is targets['DEV'] else 'UAT'
+        if target == 'UAT':
+            raise dbapi.Error('control table unavailable')
+        statuses.append((target, args[-1]))
+
+    assert not etl.process_csv_file_in_chunks(
+        targets, path, 'T_CONTROL', timestamp='2026-01-01 00:00:00',
+        control_callback=control_callback,
+    )
+    assert statuses == [('DEV', 'BODS COMPLETED')]
+    assert len(targets['DEV'].rows) == len(targets['UAT'].rows) == 2
+
+
+@pytest.mark.parametrize('queue_depth', [0, -1])
+def test_queue_stays_bounded(etl, queue_depth):
+    assert etl.TargetLoader('DEV', FakeCursor(), 'T', queue_depth).chunks.maxsize == 1